@@ -1,59 +1,154 @@
 """Job management for transcription service using Redis."""
 
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
-import redis
-import json
+import orjson
+import redis.asyncio as redis
 
+from config import config
 from redis_queue import RedisQueue
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+
+def iso_now() -> str:
+    """Current UTC time as an ISO-8601 string, with the tzinfo cached."""
+    return datetime.now(_UTC).isoformat()
+
+
+# Atomically patch a job status hash server-side: update only the
+# changed fields, refresh the TTL and adjust the status counters — one
+# round-trip, no read-modify-write race between workers.
+# KEYS[1] = job status key, KEYS[2] = stats hash key
+# ARGV[1] = new status, ARGV[2] = error message ('' = none), ARGV[3] = completed_at
+_UPDATE_STATUS_SCRIPT = """
+local old = redis.call('HGET', KEYS[1], 'status')
+if not old then return 0 end
+redis.call('HSET', KEYS[1], 'status', ARGV[1])
+if ARGV[2] ~= '' then redis.call('HSET', KEYS[1], 'error_message', ARGV[2]) end
+if ARGV[1] == 'completed' or ARGV[1] == 'failed' then
+    redis.call('HSET', KEYS[1], 'completed_at', ARGV[3])
+end
+redis.call('EXPIRE', KEYS[1], 86400)
+if old ~= ARGV[1] then
+    redis.call('HINCRBY', KEYS[2], old, -1)
+    redis.call('HINCRBY', KEYS[2], ARGV[1], 1)
+end
+return 1
+"""
+
+# Terminal-state variant of the update script that also acks the job:
+# the status write, counter adjustment and processing-list LREM land in
+# one round-trip instead of two per finished job.
+# KEYS[1] = job status key, KEYS[2] = stats hash key, KEYS[3] = processing list
+# ARGV[1] = terminal status, ARGV[2] = error message ('' = none),
+# ARGV[3] = completed_at, ARGV[4] = queue payload to remove
+_COMPLETE_JOB_SCRIPT = """
+local old = redis.call('HGET', KEYS[1], 'status')
+if old then
+    redis.call('HSET', KEYS[1], 'status', ARGV[1])
+    if ARGV[2] ~= '' then redis.call('HSET', KEYS[1], 'error_message', ARGV[2]) end
+    redis.call('HSET', KEYS[1], 'completed_at', ARGV[3])
+    redis.call('EXPIRE', KEYS[1], 86400)
+    if old ~= ARGV[1] then
+        redis.call('HINCRBY', KEYS[2], old, -1)
+        redis.call('HINCRBY', KEYS[2], ARGV[1], 1)
+    end
+end
+return redis.call('LREM', KEYS[3], 1, ARGV[4])
+"""
+
+# Recount job statuses entirely server-side so a rebuild ships a
+# five-integer tally instead of every job record. Blocks Redis while it
+# scans, so this is only for the reconciliation path, never the hot one.
+# KEYS[1] = stats hash key, ARGV[1] = job key match pattern
+_REBUILD_STATS_SCRIPT = """
+local cursor = '0'
+local counts = {queued = 0, processing = 0, completed = 0, failed = 0}
+local total = 0
+repeat
+    local result = redis.call('SCAN', cursor, 'MATCH', ARGV[1], 'COUNT', 1000)
+    cursor = result[1]
+    for _, key in ipairs(result[2]) do
+        local status = redis.call('HGET', key, 'status')
+        if status then
+            counts[status] = (counts[status] or 0) + 1
+            total = total + 1
+        end
+    end
+until cursor == '0'
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1],
+    'total', total,
+    'queued', counts.queued,
+    'processing', counts.processing,
+    'completed', counts.completed,
+    'failed', counts.failed)
+return {total, counts.queued, counts.processing, counts.completed, counts.failed}
+"""
+
 
 class JobManager:
     """Manages transcription jobs and their status using Redis."""
 
+    # How long get_stats may serve a cached snapshot, in seconds
+    STATS_CACHE_TTL = 1.0
+
     def __init__(self, redis_url: str):
         """Initialize JobManager with Redis backend.
 
         Args:
             redis_url: Redis connection URL
         """
-        self.redis_client = redis.from_url(redis_url, decode_responses=True)
-        self.redis_queue = RedisQueue(redis_url)
+        # One shared pool for JobManager and RedisQueue so connection
+        # count stays bounded as workers scale
+        self.pool = redis.BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=config.max_concurrent_jobs * 2 + 4,
+            timeout=5,
+            decode_responses=True
+        )
+        self.redis_client = redis.Redis(connection_pool=self.pool)
+        self.redis_queue = RedisQueue(pool=self.pool)
         self.job_status_prefix = "transcription:job:"
+        self.stats_key = "transcription:stats"
+        self._update_status_script = self.redis_client.register_script(_UPDATE_STATUS_SCRIPT)
+        self._complete_job_script = self.redis_client.register_script(_COMPLETE_JOB_SCRIPT)
+        self._rebuild_stats_script = self.redis_client.register_script(_REBUILD_STATS_SCRIPT)
+        self._stats_cache: Optional[Dict[str, int]] = None
+        self._stats_cache_time = 0.0
 
-        # Test Redis connection
-        if not self.redis_queue.ping():
+    async def start(self):
+        """Verify the Redis connection and recover in-flight jobs."""
+        if not await self.redis_queue.ping():
             raise ConnectionError("Failed to connect to Redis")
 
+        # Requeue any jobs a previous run left mid-processing
+        recovered = await self.redis_queue.recover_processing()
+        if recovered:
+            logger.info(f"Requeued {recovered} jobs from the processing list")
+
         logger.info("JobManager initialized with Redis backend")
 
-    def create_job(self, meeting_id: str, filename: str, webhook_url: str) -> str:
+    async def create_job(self, meeting_id: str, filename: str, webhook_url: str) -> str:
         """Create a new transcription job and return job ID."""
         job_id = str(uuid.uuid4())
 
-        # Store job status in Redis
+        # Store job status as a Redis hash; optional fields (completed_at,
+        # error_message) are only set once they have a value
         job_status = {
             "job_id": job_id,
             "status": "queued",
             "meeting_id": meeting_id,
             "filename": filename,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "completed_at": None,
-            "error_message": None
+            "created_at": iso_now()
         }
 
-        job_status_key = f"{self.job_status_prefix}{job_id}"
-        self.redis_client.setex(
-            job_status_key,
-            86400,  # TTL: 24 hours
-            json.dumps(job_status)
-        )
-
-        # Queue job for processing
         job_data = {
             "job_id": job_id,
             "meeting_id": meeting_id,
@@ -61,85 +156,159 @@ class JobManager:
             "webhook_url": webhook_url
         }
 
-        self.redis_queue.enqueue(job_data)
+        # Store status, bump counters and enqueue in one round-trip
+        job_status_key = f"{self.job_status_prefix}{job_id}"
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.hset(job_status_key, mapping=job_status)
+        pipe.expire(job_status_key, 86400)  # TTL: 24 hours
+        pipe.hincrby(self.stats_key, "queued", 1)
+        pipe.hincrby(self.stats_key, "total", 1)
+        self.redis_queue.enqueue_pipe(pipe, job_data)
+        await pipe.execute()
+
         logger.info(f"Queued transcription job {job_id} for meeting {meeting_id}, file {filename}")
 
         return job_id
 
-    def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Get status of a specific job from Redis."""
-        job_status_key = f"{self.job_status_prefix}{job_id}"
-        job_data = self.redis_client.get(job_status_key)
+    async def create_jobs(self, requests: List[Dict[str, str]]) -> List[str]:
+        """Create and enqueue several transcription jobs in one round-trip.
 
-        if job_data:
-            return json.loads(job_data)
-        return None
+        Args:
+            requests: List of dicts with meeting_id, filename and webhook_url
 
-    def update_job_status(self, job_id: str, status: str, error_message: Optional[str] = None):
-        """Update job status in Redis."""
-        job_status = self.get_job_status(job_id)
+        Returns:
+            List of job IDs in request order
+        """
+        job_ids = []
+        created_at = iso_now()
+        pipe = self.redis_client.pipeline(transaction=False)
 
-        if job_status:
-            job_status["status"] = status
-            if error_message:
-                job_status["error_message"] = error_message
-            if status in ["completed", "failed"]:
-                job_status["completed_at"] = datetime.now(timezone.utc).isoformat()
+        for request in requests:
+            job_id = str(uuid.uuid4())
+            job_ids.append(job_id)
 
+            job_status = {
+                "job_id": job_id,
+                "status": "queued",
+                "meeting_id": request["meeting_id"],
+                "filename": request["filename"],
+                "created_at": created_at
+            }
             job_status_key = f"{self.job_status_prefix}{job_id}"
-            self.redis_client.setex(
-                job_status_key,
-                86400,  # TTL: 24 hours
-                json.dumps(job_status)
-            )
+            pipe.hset(job_status_key, mapping=job_status)
+            pipe.expire(job_status_key, 86400)  # TTL: 24 hours
+
+            self.redis_queue.enqueue_pipe(pipe, {
+                "job_id": job_id,
+                "meeting_id": request["meeting_id"],
+                "filename": request["filename"],
+                "webhook_url": request["webhook_url"]
+            })
 
-    def get_next_job(self, timeout: int = 1) -> Optional[Dict[str, Any]]:
+        pipe.hincrby(self.stats_key, "queued", len(requests))
+        pipe.hincrby(self.stats_key, "total", len(requests))
+        await pipe.execute()
+
+        logger.info(f"Queued {len(job_ids)} transcription jobs in one batch")
+        return job_ids
+
+    async def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get status of a specific job from Redis."""
+        job_status_key = f"{self.job_status_prefix}{job_id}"
+        job_status = await self.redis_client.hgetall(job_status_key)
+
+        if not job_status:
+            return None
+
+        job_status.setdefault("completed_at", None)
+        job_status.setdefault("error_message", None)
+        return job_status
+
+    async def update_job_status(self, job_id: str, status: str, error_message: Optional[str] = None):
+        """Update job status in Redis via an atomic server-side script."""
+        job_status_key = f"{self.job_status_prefix}{job_id}"
+        await self._update_status_script(
+            keys=[job_status_key, self.stats_key],
+            args=[
+                status,
+                error_message or "",
+                iso_now()
+            ]
+        )
+
+    async def get_next_job(self, timeout: int = 1) -> Optional[Dict[str, Any]]:
         """Get the next job from the Redis queue."""
-        return self.redis_queue.dequeue(timeout=timeout)
+        return await self.redis_queue.dequeue(timeout=timeout)
+
+    async def complete_job(self, job_data: Dict[str, Any], status: str,
+                           error_message: Optional[str] = None):
+        """Record a job's terminal status and acknowledge it atomically.
+
+        Combines the status/counter update with the processing-list
+        removal in one server-side script, halving the Redis round-trips
+        spent on every finished job.
 
-    def mark_job_done(self):
-        """Mark current job as done (no-op for Redis, kept for compatibility)."""
-        pass
+        Args:
+            job_data: Job data dictionary as returned by get_next_job
+            status: Terminal status, "completed" or "failed"
+            error_message: Error description for failed jobs
+        """
+        job_status_key = f"{self.job_status_prefix}{job_data['job_id']}"
+        await self._complete_job_script(
+            keys=[job_status_key, self.stats_key, self.redis_queue.processing_key],
+            args=[
+                status,
+                error_message or "",
+                iso_now(),
+                orjson.dumps(job_data)
+            ]
+        )
 
-    def get_queue_size(self) -> int:
+    async def get_queue_size(self) -> int:
         """Get current queue size from Redis."""
-        return self.redis_queue.get_queue_size()
-
-    def get_stats(self) -> Dict[str, int]:
-        """Get processing statistics from Redis."""
-        # Scan for all job keys
-        job_keys = []
-        cursor = 0
-        while True:
-            cursor, keys = self.redis_client.scan(
-                cursor,
-                match=f"{self.job_status_prefix}*",
-                count=100
+        return await self.redis_queue.get_queue_size()
+
+    async def get_stats(self) -> Dict[str, int]:
+        """Get processing statistics from the Redis counter hash.
+
+        Counters are maintained incrementally by create_job and
+        update_job_status, so this is a single HGETALL regardless of
+        how many job records exist. Results are cached for one second
+        so frequent monitor polling doesn't hammer Redis.
+        """
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache_time < self.STATS_CACHE_TTL:
+            return self._stats_cache
+
+        counters = await self.redis_client.hgetall(self.stats_key)
+
+        stats = {
+            "total_jobs": int(counters.get("total", 0)),
+            "completed_jobs": int(counters.get("completed", 0)),
+            "failed_jobs": int(counters.get("failed", 0)),
+            "processing_jobs": int(counters.get("processing", 0)),
+            "queued_jobs": int(counters.get("queued", 0)),
+            "queue_size": await self.get_queue_size()
+        }
+
+        self._stats_cache = stats
+        self._stats_cache_time = now
+        return stats
+
+    async def rebuild_stats(self) -> Dict[str, int]:
+        """Recount job statuses server-side and reset the counter hash.
+
+        The scan, per-key status reads and counter reset all run inside
+        one Lua script, so only the final tally crosses the wire.
+        Expensive reconciliation path; get_stats serves the incremental
+        counters on the hot path.
+        """
+        total_jobs, queued_jobs, processing_jobs, completed_jobs, failed_jobs = (
+            await self._rebuild_stats_script(
+                keys=[self.stats_key],
+                args=[f"{self.job_status_prefix}*"]
             )
-            job_keys.extend(keys)
-            if cursor == 0:
-                break
-
-        # Count jobs by status
-        total_jobs = len(job_keys)
-        completed_jobs = 0
-        failed_jobs = 0
-        processing_jobs = 0
-        queued_jobs = 0
-
-        for key in job_keys:
-            job_data = self.redis_client.get(key)
-            if job_data:
-                job_status = json.loads(job_data)
-                status = job_status.get("status", "")
-                if status == "completed":
-                    completed_jobs += 1
-                elif status == "failed":
-                    failed_jobs += 1
-                elif status == "processing":
-                    processing_jobs += 1
-                elif status == "queued":
-                    queued_jobs += 1
+        )
 
         return {
             "total_jobs": total_jobs,
@@ -147,5 +316,5 @@ class JobManager:
             "failed_jobs": failed_jobs,
             "processing_jobs": processing_jobs,
             "queued_jobs": queued_jobs,
-            "queue_size": self.get_queue_size()
+            "queue_size": await self.get_queue_size()
         }
\ No newline at end of file
@@ -1,14 +1,16 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
+import asyncio
 import logging
-from datetime import datetime, timezone
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from config import config
-from job_manager import JobManager
+from job_manager import JobManager, iso_now
 from transcription_worker import TranscriptionWorker
+from webhook_handler import WebhookHandler, webhook_dispatcher
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,7 +20,37 @@ config_error = config.validate()
 if config_error:
     logger.warning(config_error)
 
-app = FastAPI(title="Meeting Transcription Service", version="1.0.0")
+# Initialize job manager with Redis; the connection is verified on startup
+job_manager = JobManager(config.redis_url)
+
+# Worker tasks - started in lifespan
+worker_tasks: List[asyncio.Task] = []
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Application lifespan manager"""
+    # Startup
+    await job_manager.start()
+    logger.info(f"Connected to Redis at {config.redis_url}")
+
+    webhook_dispatcher.start()
+    for i in range(config.max_concurrent_jobs):
+        worker = TranscriptionWorker(job_manager, i + 1)
+        worker_tasks.append(worker.start_task())
+
+    yield
+
+    # Shutdown
+    for task in worker_tasks:
+        task.cancel()
+    await asyncio.gather(*worker_tasks, return_exceptions=True)
+    worker_tasks.clear()
+    await webhook_dispatcher.stop()
+    await WebhookHandler.aclose()
+
+
+app = FastAPI(title="Meeting Transcription Service", version="1.0.0", lifespan=lifespan)
 
 # Only allow requests from the web server
 app.add_middleware(
@@ -29,19 +61,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize job manager with Redis
-try:
-    job_manager = JobManager(config.redis_url)
-    logger.info(f"Connected to Redis at {config.redis_url}")
-except Exception as e:
-    logger.error(f"Failed to initialize JobManager with Redis: {e}")
-    raise
-
 class TranscriptionRequest(BaseModel):
     meeting_id: str
     filename: str
     webhook_url: str
 
+class BatchTranscriptionRequest(BaseModel):
+    requests: List[TranscriptionRequest]
+
 class JobStatus(BaseModel):
     job_id: str
     status: str  # "queued", "processing", "completed", "failed"
@@ -49,13 +76,6 @@ class JobStatus(BaseModel):
     completed_at: Optional[str] = None
     error_message: Optional[str] = None
 
-# Start worker threads
-workers = []
-for i in range(config.max_concurrent_jobs):
-    worker = TranscriptionWorker(job_manager, i + 1)
-    thread = worker.start_thread()
-    workers.append((worker, thread))
-
 @app.get("/")
 async def root():
     return {"message": "Meeting Transcription Service", "version": "1.0.0"}
@@ -64,15 +84,21 @@ async def root():
 async def health_check():
     return {
         "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "queue_size": job_manager.get_queue_size(),
+        "timestamp": iso_now(),
+        "queue_size": await job_manager.get_queue_size(),
         "max_workers": config.max_concurrent_jobs
     }
 
 @app.get("/stats")
-async def get_stats():
-    """Get processing statistics"""
-    return job_manager.get_stats()
+async def get_stats(refresh: bool = False):
+    """Get processing statistics
+
+    The default path reads the incrementally maintained counters;
+    pass refresh=true to recount from the job records (expensive).
+    """
+    if refresh:
+        return await job_manager.rebuild_stats()
+    return await job_manager.get_stats()
 
 @app.post("/transcribe")
 async def transcribe_audio_file(request: TranscriptionRequest):
@@ -88,23 +114,53 @@ async def transcribe_audio_file(request: TranscriptionRequest):
     
     try:
         # Create and queue job
-        job_id = job_manager.create_job(request.meeting_id, request.filename, request.webhook_url)
+        job_id = await job_manager.create_job(request.meeting_id, request.filename, request.webhook_url)
         
         return {
             "job_id": job_id,
             "status": "queued",
             "message": f"Audio file {request.filename} queued for transcription",
-            "queue_position": job_manager.get_queue_size()
+            "queue_position": await job_manager.get_queue_size()
         }
         
     except Exception as e:
         logger.error(f"Error processing transcription request: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to process transcription request: {str(e)}")
 
+@app.post("/transcribe/batch")
+async def transcribe_audio_files(batch: BatchTranscriptionRequest):
+    """Accept multiple audio files and queue them in one Redis round-trip"""
+
+    if not config.openai_api_key:
+        raise HTTPException(status_code=500, detail="OpenAI API key not configured")
+
+    if not batch.requests:
+        raise HTTPException(status_code=400, detail="No transcription requests provided")
+
+    # Check all audio files exist before queueing anything
+    for request in batch.requests:
+        audio_file_path = Path(config.shared_audio_path) / request.meeting_id / "audio" / request.filename
+        if not audio_file_path.exists():
+            raise HTTPException(status_code=404, detail=f"Audio file not found: {request.filename}")
+
+    try:
+        job_ids = await job_manager.create_jobs([request.model_dump() for request in batch.requests])
+
+        return {
+            "job_ids": job_ids,
+            "status": "queued",
+            "message": f"{len(job_ids)} audio files queued for transcription",
+            "queue_size": await job_manager.get_queue_size()
+        }
+
+    except Exception as e:
+        logger.error(f"Error processing batch transcription request: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to process batch transcription request: {str(e)}")
+
 @app.get("/job/{job_id}")
 async def get_job_status_endpoint(job_id: str):
     """Get status of a specific transcription job"""
-    job_status = job_manager.get_job_status(job_id)
+    job_status = await job_manager.get_job_status(job_id)
     if not job_status:
         raise HTTPException(status_code=404, detail="Job not found")
     
@@ -1,35 +1,58 @@
 """Redis-based queue manager for transcription jobs."""
 
-import redis
-import json
+import redis.asyncio as redis
+import orjson
 import logging
 from typing import Optional, Dict, Any
 
+from config import config
+
 logger = logging.getLogger(__name__)
 
 
 class RedisQueue:
     """Redis-based job queue with pub/sub support."""
 
-    def __init__(self, redis_url: str):
+    def __init__(self, redis_url: Optional[str] = None, pool: Optional[redis.ConnectionPool] = None):
         """Initialize Redis connection.
 
         Args:
             redis_url: Redis connection URL (e.g., redis://localhost:6379)
+            pool: Existing connection pool to share instead of opening
+                a new one from redis_url
         """
-        self.redis_client = redis.from_url(redis_url, decode_responses=True)
+        if pool is not None:
+            self.redis_client = redis.Redis(connection_pool=pool)
+            # Blocking commands (BLMOVE) pin a connection for their full
+            # timeout, so give them their own small pool rather than
+            # starving fast commands behind the shared pool cap
+            blocking_pool = redis.ConnectionPool(
+                connection_class=pool.connection_class,
+                max_connections=config.max_concurrent_jobs,
+                **pool.connection_kwargs
+            )
+        elif redis_url is not None:
+            self.redis_client = redis.from_url(redis_url, decode_responses=True)
+            blocking_pool = redis.ConnectionPool.from_url(
+                redis_url,
+                max_connections=config.max_concurrent_jobs,
+                decode_responses=True
+            )
+        else:
+            raise ValueError("Either redis_url or pool must be provided")
+        self._blocking_client = redis.Redis(connection_pool=blocking_pool)
         self.queue_key = "transcription:job_queue"
         self.processing_key = "transcription:processing"
 
-    def ping(self) -> bool:
+    async def ping(self) -> bool:
         """Check if Redis is accessible."""
         try:
-            return self.redis_client.ping()
+            return await self.redis_client.ping()
         except Exception as e:
             logger.error(f"Redis ping failed: {e}")
             return False
 
-    def enqueue(self, job_data: Dict[str, Any]) -> bool:
+    async def enqueue(self, job_data: Dict[str, Any]) -> bool:
         """Add a job to the queue.
 
         Args:
@@ -39,15 +62,30 @@ class RedisQueue:
             True if successful, False otherwise
         """
         try:
-            job_json = json.dumps(job_data)
-            self.redis_client.rpush(self.queue_key, job_json)
+            job_json = orjson.dumps(job_data)
+            await self.redis_client.rpush(self.queue_key, job_json)
             return True
         except Exception as e:
             logger.error(f"Failed to enqueue job: {e}")
             return False
 
-    def dequeue(self, timeout: int = 1) -> Optional[Dict[str, Any]]:
-        """Get the next job from the queue (blocking).
+    def enqueue_pipe(self, pipe, job_data: Dict[str, Any]) -> None:
+        """Append an enqueue command to a caller-supplied pipeline.
+
+        Lets callers combine the RPUSH with other commands in a single
+        round-trip; the caller is responsible for executing the pipeline.
+
+        Args:
+            pipe: Redis pipeline to append to
+            job_data: Job data dictionary
+        """
+        pipe.rpush(self.queue_key, orjson.dumps(job_data))
+
+    async def dequeue(self, timeout: int = 1) -> Optional[Dict[str, Any]]:
+        """Reserve the next job from the queue (blocking).
+
+        The job is atomically moved onto the processing list so it can
+        be recovered if the worker crashes; call ack() once it is done.
 
         Args:
             timeout: Timeout in seconds for blocking pop
@@ -56,35 +94,66 @@ class RedisQueue:
             Job data dictionary or None if timeout/error
         """
         try:
-            result = self.redis_client.blpop(self.queue_key, timeout=timeout)
-            if result:
-                _, job_json = result
-                return json.loads(job_json)
+            job_json = await self._blocking_client.blmove(
+                self.queue_key, self.processing_key, timeout, "LEFT", "RIGHT"
+            )
+            if job_json:
+                return orjson.loads(job_json)
             return None
         except Exception as e:
             logger.error(f"Failed to dequeue job: {e}")
             return None
 
-    def get_queue_size(self) -> int:
+    async def ack(self, job_data: Dict[str, Any]) -> bool:
+        """Remove a finished job from the processing list.
+
+        Args:
+            job_data: Job data dictionary as returned by dequeue
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self.redis_client.lrem(self.processing_key, 1, orjson.dumps(job_data))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to ack job: {e}")
+            return False
+
+    async def recover_processing(self) -> int:
+        """Requeue jobs left on the processing list by a previous run.
+
+        Returns:
+            Number of jobs moved back onto the queue
+        """
+        recovered = 0
+        try:
+            while await self.redis_client.lmove(self.processing_key, self.queue_key, "LEFT", "LEFT"):
+                recovered += 1
+        except Exception as e:
+            logger.error(f"Failed to recover processing jobs: {e}")
+        return recovered
+
+    async def get_queue_size(self) -> int:
         """Get the current queue size.
 
         Returns:
             Number of jobs in queue
         """
         try:
-            return self.redis_client.llen(self.queue_key)
+            return await self.redis_client.llen(self.queue_key)
         except Exception as e:
             logger.error(f"Failed to get queue size: {e}")
             return 0
 
-    def clear_queue(self) -> bool:
+    async def clear_queue(self) -> bool:
         """Clear all jobs from the queue.
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            self.redis_client.delete(self.queue_key)
+            await self.redis_client.delete(self.queue_key)
             return True
         except Exception as e:
             logger.error(f"Failed to clear queue: {e}")
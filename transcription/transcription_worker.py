@@ -1,66 +1,92 @@
 """Transcription worker for processing audio files."""
 
-import threading
+import asyncio
 import logging
-from datetime import datetime, timezone
+import mmap
+import os
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any
+import httpx
 import openai
 
 from config import config
-from job_manager import JobManager
-from webhook_handler import WebhookHandler
+from job_manager import JobManager, iso_now
+from webhook_handler import webhook_dispatcher
 
 logger = logging.getLogger(__name__)
 
+# One SDK client shared by all workers so burst submissions draw from a
+# single keepalive pool sized for the worker count, instead of each
+# worker holding a default-sized pool of its own. None when no API key
+# is configured (the API refuses to queue jobs in that case).
+_openai_client = openai.AsyncOpenAI(
+    api_key=config.openai_api_key,
+    http_client=httpx.AsyncClient(
+        timeout=httpx.Timeout(connect=5, read=300, write=60, pool=5),
+        limits=httpx.Limits(
+            max_connections=max(32, config.max_concurrent_jobs * 4),
+            max_keepalive_connections=16
+        )
+    )
+) if config.openai_api_key else None
+
 
 class TranscriptionWorker:
     """Worker class for processing transcription jobs."""
-    
+
     def __init__(self, job_manager: JobManager, worker_id: int):
         self.job_manager = job_manager
         self.worker_id = worker_id
-        self.webhook_handler = WebhookHandler()
-        
-        # Set OpenAI API key
-        if config.openai_api_key:
-            openai.api_key = config.openai_api_key
-    
-    def process_job(self, job_data: Dict[str, Any]) -> None:
+
+        self.client = _openai_client
+
+    async def process_job(self, job_data: Dict[str, Any]) -> None:
         """Process a single transcription job."""
         job_id = job_data["job_id"]
         meeting_id = job_data["meeting_id"]
         filename = job_data["filename"]
         webhook_url = job_data["webhook_url"]
-        
+
         logger.info(f"Worker {self.worker_id}: Starting transcription job {job_id} for meeting {meeting_id}, file {filename}")
-        self.job_manager.update_job_status(job_id, "processing")
-        
-        start_time = datetime.now()
-        
+        await self.job_manager.update_job_status(job_id, "processing")
+
+        start_time = time.monotonic()
+
         try:
             # Build file path - files are in audio folder
             audio_file_path = Path(config.shared_audio_path) / meeting_id / "audio" / filename
-            
+
             if not audio_file_path.exists():
                 raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
-            
+
             logger.info(f"Worker {self.worker_id}: Processing audio file: {audio_file_path}")
-            
-            # Process audio with OpenAI Whisper
-            with open(audio_file_path, 'rb') as audio_file:
-                response = openai.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    response_format="verbose_json"
-                )
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
+
+            if self.client is None:
+                raise RuntimeError("OpenAI API key not configured")
+
+            # Upload straight from the page cache via mmap instead of
+            # copying the whole file into a bytes object first
+            fd = os.open(audio_file_path, os.O_RDONLY)
+            try:
+                mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                try:
+                    response = await self.client.audio.transcriptions.create(
+                        model="whisper-1",
+                        file=(filename, mm, "audio/webm"),
+                        response_format="verbose_json"
+                    )
+                finally:
+                    mm.close()
+            finally:
+                os.close(fd)
+
+            processing_time = time.monotonic() - start_time
+
             # Extract transcription results
             transcription_text = response.text
             confidence = getattr(response, 'confidence', 0.9)  # Whisper doesn't always provide confidence
-            
+
             # Prepare success webhook result
             result_data = {
                 "job_id": job_id,
@@ -70,25 +96,23 @@ class TranscriptionWorker:
                 "confidence": confidence,
                 "processing_time": processing_time,
                 "status": "completed",
-                "processed_at": datetime.now(timezone.utc).isoformat()
+                "processed_at": iso_now()
             }
-            
-            # Send webhook
-            webhook_success = self.webhook_handler.send_webhook_sync(webhook_url, result_data)
-            
-            if webhook_success:
-                self.job_manager.update_job_status(job_id, "completed")
-                logger.info(f"Worker {self.worker_id}: Transcription job {job_id} completed successfully")
-            else:
-                logger.warning(f"Worker {self.worker_id}: Job {job_id} completed but webhook failed")
-                self.job_manager.update_job_status(job_id, "completed")
-            
+
+            # Hand the webhook to the dispatcher; delivery and retries
+            # happen in the background so the worker can take the next job
+            webhook_dispatcher.enqueue(webhook_url, result_data)
+
+            # Terminal status write and queue ack share one round-trip
+            await self.job_manager.complete_job(job_data, "completed")
+            logger.info(f"Worker {self.worker_id}: Transcription job {job_id} completed successfully")
+
         except Exception as e:
             error_message = str(e)
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
+            processing_time = time.monotonic() - start_time
+
             logger.error(f"Worker {self.worker_id}: Transcription job {job_id} failed: {error_message}")
-            
+
             # Prepare failure webhook result
             result_data = {
                 "job_id": job_id,
@@ -97,28 +121,29 @@ class TranscriptionWorker:
                 "status": "failed",
                 "error_message": error_message,
                 "processing_time": processing_time,
-                "processed_at": datetime.now(timezone.utc).isoformat()
+                "processed_at": iso_now()
             }
-            
+
             # Send failure webhook
-            self.webhook_handler.send_webhook_sync(webhook_url, result_data)
-            self.job_manager.update_job_status(job_id, "failed", error_message)
-    
-    def run(self) -> None:
+            webhook_dispatcher.enqueue(webhook_url, result_data)
+            await self.job_manager.complete_job(job_data, "failed", error_message)
+
+    async def run(self) -> None:
         """Main worker loop that processes jobs from the queue."""
         logger.info(f"Starting transcription worker {self.worker_id}")
         while True:
             try:
-                job_data = self.job_manager.get_next_job(timeout=1)
+                job_data = await self.job_manager.get_next_job(timeout=1)
                 if job_data:
-                    self.process_job(job_data)
-                    self.job_manager.mark_job_done()
+                    await self.process_job(job_data)
+            except asyncio.CancelledError:
+                logger.info(f"Transcription worker {self.worker_id} stopped")
+                raise
             except Exception as e:
                 logger.error(f"Worker {self.worker_id} error: {e}")
-    
-    def start_thread(self) -> threading.Thread:
-        """Start the worker in a daemon thread."""
-        thread = threading.Thread(target=self.run, daemon=True)
-        thread.start()
-        logger.info(f"Started worker thread {self.worker_id}")
-        return thread
\ No newline at end of file
+
+    def start_task(self) -> asyncio.Task:
+        """Start the worker as a task on the running event loop."""
+        task = asyncio.create_task(self.run(), name=f"transcription-worker-{self.worker_id}")
+        logger.info(f"Started worker task {self.worker_id}")
+        return task
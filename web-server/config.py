@@ -9,6 +9,9 @@ class Config:
     # Database
     MONGODB_URL: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
     DATABASE_NAME: str = "meeting_db"
+    MONGODB_MAX_POOL_SIZE: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+    MONGODB_MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "5"))
+    MEETINGS_BATCH_SIZE: int = int(os.getenv("MEETINGS_BATCH_SIZE", "500"))
     
     # Services
     TRANSCRIPTION_SERVICE_URL: str = os.getenv("TRANSCRIPTION_SERVICE_URL", "http://localhost:8001")
@@ -1,5 +1,6 @@
 """Database connection and operations."""
 
+import asyncio
 import logging
 from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -16,11 +17,23 @@ class Database:
     @classmethod
     async def connect(cls):
         """Initialize database connection."""
-        cls.client = AsyncIOMotorClient(config.MONGODB_URL)
+        cls.client = AsyncIOMotorClient(
+            config.MONGODB_URL,
+            maxPoolSize=config.MONGODB_MAX_POOL_SIZE,
+            minPoolSize=config.MONGODB_MIN_POOL_SIZE,
+            maxIdleTimeMS=60000,
+            serverSelectionTimeoutMS=5000,
+            retryWrites=True,
+        )
         cls.db = cls.client[config.DATABASE_NAME]
-        
+
         try:
-            await cls.client.admin.command('ping')
+            # Concurrent pings grow the connection pool up front so the
+            # first burst of requests doesn't each pay connection setup
+            await asyncio.gather(
+                *(cls.client.admin.command('ping')
+                  for _ in range(config.MONGODB_MIN_POOL_SIZE))
+            )
             logger.info("Connected to MongoDB successfully")
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
@@ -1,12 +1,22 @@
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
+import asyncio
 import os
 import logging
 import uuid
 from contextlib import asynccontextmanager
 from bson import ObjectId
 
+try:
+    # uvloop's C event loop is noticeably faster for the socket-heavy
+    # websocket + Motor workload; fall back to the stdlib loop if absent
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 from config import config
 from database import database
 from models import (
@@ -18,7 +28,8 @@ from services import (
     TranscriptionWebhookService,
     AudioFileService,
     TranscriptionService,
-    ConnectionManager
+    ConnectionManager,
+    meeting_oid
 )
 
 logging.basicConfig(level=getattr(logging, config.LOG_LEVEL))
@@ -40,7 +51,11 @@ async def lifespan(_app: FastAPI):
     
     # Initialize database
     await database.connect()
-    
+
+    # Index backing get_meetings' sort; create_index is idempotent
+    await database.get_db().meetings.create_index([("created_at", -1)])
+
+
     # Ensure shared audio directory exists
     os.makedirs(config.SHARED_AUDIO_PATH, exist_ok=True)
     
@@ -58,14 +73,16 @@ async def lifespan(_app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down application...")
+    await transcription_service.aclose()
     await database.close()
     logger.info("Application shutdown complete")
 
 
 app = FastAPI(
-    title="Meeting Transcription API", 
+    title="Meeting Transcription API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -113,36 +130,65 @@ async def create_meeting(meeting: MeetingCreate):
     """Create a new meeting"""
     return await MeetingService.create_meeting(meeting)
 
-@app.get("/meetings", response_model=List[Meeting])
+@app.get("/meetings")
 async def get_meetings():
     """Get all meetings for the current user"""
+    # No response_model: the service returns dicts already in the
+    # Meeting wire shape, skipping per-document validation
     return await MeetingService.get_meetings()
 
-@app.get("/meetings/{meeting_id}", response_model=Meeting)
-async def get_meeting(meeting_id: str):
+@app.get("/meetings/{meeting_id}")
+async def get_meeting(oid: ObjectId = Depends(meeting_oid)):
     """Get a specific meeting by ID"""
-    return await MeetingService.get_meeting(meeting_id)
+    # No response_model: the service returns a constructed Meeting (or
+    # prebuilt JSON bytes for large transcripts); a response_model here
+    # would re-validate the model on the way out and undo the skip
+    return await MeetingService.get_meeting(oid)
 
 @app.put("/meetings/{meeting_id}", response_model=Meeting)
-async def update_meeting(meeting_id: str, meeting_update: MeetingUpdate):
+async def update_meeting(meeting_update: MeetingUpdate, oid: ObjectId = Depends(meeting_oid)):
     """Update a meeting"""
-    return await MeetingService.update_meeting(meeting_id, meeting_update)
+    return await MeetingService.update_meeting(oid, meeting_update)
 
 @app.delete("/meetings/{meeting_id}")
-async def delete_meeting(meeting_id: str):
+async def delete_meeting(oid: ObjectId = Depends(meeting_oid)):
     """Delete a meeting"""
-    return await MeetingService.delete_meeting(meeting_id)
+    return await MeetingService.delete_meeting(oid)
 
 @app.put("/meetings/{meeting_id}/keywords", response_model=Meeting)
-async def update_meeting_keywords(meeting_id: str, keywords_update: KeywordsUpdate):
+async def update_meeting_keywords(keywords_update: KeywordsUpdate, oid: ObjectId = Depends(meeting_oid)):
     """Update keywords for a specific meeting"""
-    return await MeetingService.update_keywords(meeting_id, keywords_update)
+    return await MeetingService.update_keywords(oid, keywords_update)
 
 @app.post("/webhook/transcription-completed")
 async def transcription_webhook(result: TranscriptionWebhookResult):
     """Receive transcription results from transcription service"""
     return await TranscriptionWebhookService.process_webhook(result, manager)
 
+async def _dispatch_transcription(meeting_id: str, filename: str):
+    """Submit one audio chunk for transcription and report failures.
+
+    Runs as a background task so the websocket receive loop never
+    waits on the transcription service round-trip.
+    """
+    try:
+        job_id = await transcription_service.submit_transcription_job(meeting_id, filename)
+
+        if job_id:
+            logger.debug("Submitted job %s for audio chunk %s", job_id, filename)
+        else:
+            # Broadcast error to all connections for this meeting
+            await manager.send_notification(
+                meeting_id,
+                "transcription_status",
+                "failed",
+                f"Failed to submit transcription job for audio chunk"
+            )
+            logger.error(f"Failed to submit job for audio chunk {filename}")
+    except Exception as e:
+        logger.error(f"Error dispatching transcription for {filename}: {e}")
+
+
 @app.websocket("/ws/meeting/{meeting_id}/audio")
 async def websocket_audio_endpoint(websocket: WebSocket, meeting_id: str):
     """WebSocket endpoint for audio streaming and real-time transcription"""
@@ -179,6 +225,9 @@ async def websocket_audio_endpoint(websocket: WebSocket, meeting_id: str):
         )
         logger.info(f"WebSocket session {session_id} started for meeting {meeting_id}")
 
+        # Keep strong references to in-flight dispatch tasks
+        dispatch_tasks: set = set()
+
         while True:
             data = await websocket.receive_bytes()
 
@@ -188,20 +237,11 @@ async def websocket_audio_endpoint(websocket: WebSocket, meeting_id: str):
 
                 filename = save_result["filename"]
 
-                # Submit to transcription service
-                job_id = await transcription_service.submit_transcription_job(meeting_id, filename)
-
-                if job_id:
-                    logger.info(f"Submitted job {job_id} for audio chunk {filename}")
-                else:
-                    # Broadcast error to all connections for this meeting
-                    await manager.send_notification(
-                        meeting_id,
-                        "transcription_status",
-                        "failed",
-                        f"Failed to submit transcription job for audio chunk"
-                    )
-                    logger.error(f"Failed to submit job for audio chunk {filename}")
+                # Submit to transcription service without blocking the
+                # receive loop on its round-trip
+                task = asyncio.create_task(_dispatch_transcription(meeting_id, filename))
+                dispatch_tasks.add(task)
+                task.add_done_callback(dispatch_tasks.discard)
 
             except Exception as e:
                 logger.error(f"Error processing audio chunk for meeting {meeting_id}: {e}")
@@ -212,6 +252,10 @@ async def websocket_audio_endpoint(websocket: WebSocket, meeting_id: str):
                     f"Error processing audio: {str(e)}"
                 )
 
+            # Explicit yield so a busy audio stream can't starve other
+            # tasks (CRUD handlers, other meetings' sockets) on the loop
+            await asyncio.sleep(0)
+
     except WebSocketDisconnect:
         manager.disconnect(meeting_id, session_id)
         audio_service.cleanup_session(session_id)
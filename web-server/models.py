@@ -1,35 +1,29 @@
 """Pydantic models for the API."""
 
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field, GetJsonSchemaHandler
-from pydantic.json_schema import JsonSchemaValue
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, WithJsonSchema
 from bson import ObjectId
 from config import config
 
 
-class PyObjectId(str):
-    """Custom Pydantic type for MongoDB ObjectId."""
-    
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+def _validate_object_id(v):
+    """Normalize an ObjectId or its hex string to the string form."""
+    if isinstance(v, ObjectId):
+        return str(v)
+    if isinstance(v, str) and ObjectId.is_valid(v):
+        return v
+    raise ValueError("Invalid objectid")
 
-    @classmethod
-    def validate(cls, v, _=None):
-        if isinstance(v, ObjectId):
-            return str(v)
-        if isinstance(v, str):
-            if not ObjectId.is_valid(v):
-                raise ValueError("Invalid objectid")
-            return v
-        raise ValueError("Invalid objectid")
 
-    @classmethod
-    def __get_pydantic_json_schema__(
-        cls, _source_type, _handler: GetJsonSchemaHandler
-    ) -> JsonSchemaValue:
-        return {"type": "string", "description": "MongoDB ObjectId"}
+# Pydantic v2-native ObjectId string type: BeforeValidator dispatches
+# inside pydantic-core rather than through the v1 __get_validators__
+# compatibility shim, which ran per field on every Meeting construction
+PyObjectId = Annotated[
+    str,
+    BeforeValidator(_validate_object_id),
+    WithJsonSchema({"type": "string", "description": "MongoDB ObjectId"}),
+]
 
 
 class MeetingBase(BaseModel):
@@ -59,13 +53,10 @@ class Meeting(MeetingBase):
     status: str = "created"
     fullTranscription: Optional[str] = Field(None, alias="full_transcription")
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {
-            ObjectId: str,
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True
+    )
 
 
 class KeywordsUpdate(BaseModel):
@@ -1,6 +1,6 @@
 """Services module for business logic and external integrations."""
 
-from .meeting_service import MeetingService
+from .meeting_service import MeetingService, meeting_oid
 from .transcription_webhook_service import TranscriptionWebhookService
 from .audio_service import AudioFileService
 from .transcription_service import TranscriptionService
@@ -8,6 +8,7 @@ from .websocket_manager import ConnectionManager
 
 __all__ = [
     "MeetingService",
+    "meeting_oid",
     "TranscriptionWebhookService",
     "AudioFileService",
     "TranscriptionService",
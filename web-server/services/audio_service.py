@@ -1,6 +1,8 @@
 """Service to handle audio file storage for meetings."""
 
+import asyncio
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime, timezone
@@ -20,6 +22,9 @@ class AudioFileService:
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.session_counters = {}  # Track chunk counters per session
+        self._session_prefixes = {}  # Cached timestamp prefix per session
+        self._ensured_dirs = set()  # Directories already created on disk
+        self._audio_dirs = {}  # Cached audio directory Path per meeting
         logger.info(f"AudioFileService initialized with base path: {self.base_path}")
 
     async def save_audio_chunk(
@@ -58,36 +63,43 @@ class AudioFileService:
             chunk_number = self.session_counters[session_id]
             self.session_counters[session_id] += 1
 
-            # Generate filename with session ID, counter, and timestamp
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+            # Generate filename with session ID, counter, and timestamp.
+            # strftime runs once per session; the counter keeps names
+            # unique and ordered without per-chunk format work
+            timestamp = self._session_prefixes.get(session_id)
+            if timestamp is None:
+                timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+                self._session_prefixes[session_id] = timestamp
             filename = f"audio_chunk_{session_id}_{chunk_number}_{timestamp}.webm"
 
-            # Create meeting audio directory
-            audio_dir = self.base_path / meeting_id / "audio"
-            audio_dir.mkdir(parents=True, exist_ok=True)
-
+            # Reuse the meeting's audio directory Path across chunks
+            audio_dir = self._audio_dirs.get(meeting_id)
+            if audio_dir is None:
+                audio_dir = self.base_path / meeting_id / "audio"
+                self._audio_dirs[meeting_id] = audio_dir
             file_path = audio_dir / filename
 
-            # Save the file
-            with open(file_path, "wb") as f:
-                f.write(audio_data)
-
-            # Get file stats
-            file_stats = file_path.stat()
+            # Disk I/O runs in a thread so a slow write never stalls the
+            # event loop under the websocket receive path
+            file_size = await asyncio.to_thread(
+                self._write_chunk, audio_dir, file_path, audio_data
+            )
 
             result = {
                 "filename": filename,
                 "file_path": str(file_path),
-                "file_size": file_stats.st_size,
+                "file_size": file_size,
                 "chunk_number": chunk_number,
                 "meeting_id": meeting_id,
                 "session_id": session_id,
                 "saved_at": datetime.now(timezone.utc).isoformat()
             }
 
-            logger.info(
-                f"Saved audio chunk {chunk_number} (session {session_id}) "
-                f"for meeting {meeting_id}: {filename} ({file_stats.st_size} bytes)"
+            # Per-chunk, so DEBUG with lazy %s formatting: the message
+            # is never built when the level is suppressed
+            logger.debug(
+                "Saved audio chunk %d (session %s) for meeting %s: %s (%d bytes)",
+                chunk_number, session_id, meeting_id, filename, file_size
             )
             return result
 
@@ -98,6 +110,21 @@ class AudioFileService:
             )
             raise
 
+    def _write_chunk(self, audio_dir: Path, file_path: Path, audio_data: bytes) -> int:
+        """Write one chunk to disk and return its size in bytes.
+
+        Runs in a worker thread; keep all blocking filesystem calls here.
+        """
+        # mkdir only on the first chunk for a directory; every later
+        # chunk skips the stat/mkdirat syscall pair
+        dir_key = str(audio_dir)
+        if dir_key not in self._ensured_dirs:
+            audio_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(dir_key)
+        with open(file_path, "wb") as f:
+            f.write(audio_data)
+        return os.stat(file_path).st_size
+
     def cleanup_session(self, session_id: str) -> None:
         """Clean up session counter when WebSocket disconnects.
 
@@ -107,3 +134,4 @@ class AudioFileService:
         if session_id in self.session_counters:
             del self.session_counters[session_id]
             logger.debug(f"Cleaned up session counter for session {session_id}")
+        self._session_prefixes.pop(session_id, None)
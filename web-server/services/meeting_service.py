@@ -1,16 +1,110 @@
 """Meeting service for CRUD operations."""
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
 from bson import ObjectId
+from bson.errors import InvalidId
 from fastapi import HTTPException
+from fastapi.responses import Response
+from pymongo import ReturnDocument, WriteConcern
 
+from config import config
 from database import database
 from models import Meeting, MeetingCreate, MeetingUpdate, KeywordsUpdate
 
 logger = logging.getLogger(__name__)
 
+# Hot-path query pieces for the meetings list, built once instead of
+# per request (treat as frozen)
+_LIST_FILTER: Dict[str, Any] = {}
+_LIST_PROJECTION = {"full_transcription": 0}
+_LIST_SORT = [("created_at", -1)]
+
+# In-process read caches for the meeting endpoints. Meetings are read
+# far more often than they change, so a short TTL plus invalidation on
+# every write path keeps repeat reads off Mongo. Per-process by design:
+# Redis belongs to the transcription service in this architecture.
+_LIST_CACHE_TTL = 5.0
+_MEETING_CACHE_TTL = 30.0
+_list_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+# Values are either a Meeting model or pre-rendered JSON bytes (large
+# transcripts, see get_meeting). Bounded: expired entries are dropped
+# on lookup and the oldest entry is evicted at the cap, so rendered
+# multi-MB transcripts can't accumulate in RAM indefinitely
+_MEETING_CACHE_MAX = 256
+_meeting_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def _cache_meeting(meeting_id: str, value: Any) -> None:
+    """Store one cache entry, evicting the oldest at the size cap."""
+    if meeting_id not in _meeting_cache and len(_meeting_cache) >= _MEETING_CACHE_MAX:
+        _meeting_cache.pop(next(iter(_meeting_cache)))
+    _meeting_cache[meeting_id] = (time.monotonic() + _MEETING_CACHE_TTL, value)
+
+# Transcripts beyond this many characters get their JSON encode pushed
+# off the event loop; roughly an hour of speech
+_LARGE_TRANSCRIPT_CHARS = 64_000
+
+
+def _render_meeting_doc(meeting: Dict[str, Any]) -> bytes:
+    """Serialize a raw meeting document to JSON bytes in the wire shape.
+
+    Runs in a worker thread from get_meeting so encoding a very large
+    transcript doesn't stall the event loop. orjson emits datetimes as
+    RFC 3339, matching the model serialization path.
+    """
+    return orjson.dumps({
+        "id": str(meeting["_id"]),
+        "title": meeting.get("title", ""),
+        "description": meeting.get("description", ""),
+        "keywords": meeting.get("keywords", []),
+        "created_at": meeting.get("created_at"),
+        "updated_at": meeting.get("updated_at"),
+        "status": meeting.get("status", "created"),
+        "full_transcription": meeting.get("full_transcription")
+    })
+
+
+def invalidate_meeting_cache(meeting_id: Optional[str] = None) -> None:
+    """Drop cached reads after a write.
+
+    Args:
+        meeting_id: Meeting whose cached document should be dropped;
+            None clears all per-meeting entries. The list cache is
+            always cleared.
+    """
+    global _list_cache
+    _list_cache = None
+    if meeting_id is None:
+        _meeting_cache.clear()
+    else:
+        _meeting_cache.pop(meeting_id, None)
+
+
+def parse_object_id(value: str) -> ObjectId:
+    """Parse a meeting ID string into an ObjectId or raise a 400.
+
+    Parses the hex string once, instead of the is_valid check followed
+    by a second parse in the ObjectId constructor.
+    """
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid meeting ID")
+
+
+def meeting_oid(meeting_id: str) -> ObjectId:
+    """FastAPI dependency that parses the meeting_id path parameter.
+
+    Routes depend on this so the hex decode happens exactly once per
+    request and service methods receive the already-parsed ObjectId.
+    """
+    return parse_object_id(meeting_id)
+
 
 class MeetingService:
     """Service for meeting operations."""
@@ -21,124 +115,194 @@ class MeetingService:
         db = database.get_db()
 
         meeting_dict = meeting_data.model_dump()
+        now = datetime.now(timezone.utc)
         meeting_dict.update({
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc),
+            "created_at": now,
+            "updated_at": now,
             "status": "created",
             "full_transcription": None
         })
 
         result = await db.meetings.insert_one(meeting_dict)
-        created_meeting = await db.meetings.find_one({"_id": result.inserted_id})
-
-        if not created_meeting:
-            raise HTTPException(status_code=500, detail="Failed to create meeting")
 
-        created_meeting["id"] = str(created_meeting["_id"])
-        return Meeting(**created_meeting)
+        # The inserted document is fully known in memory; no need to
+        # read it back from Mongo
+        meeting_dict["id"] = str(result.inserted_id)
+        invalidate_meeting_cache()
+        return Meeting(**meeting_dict)
 
     @staticmethod
-    async def get_meetings() -> List[Meeting]:
-        """Get all meetings."""
+    async def get_meetings() -> List[Dict[str, Any]]:
+        """Get all meetings.
+
+        Returns plain dicts in the Meeting wire shape rather than
+        validated models: the documents come straight from our own
+        database, and per-document Pydantic validation dominates CPU
+        once the list grows to hundreds of meetings.
+        """
+        global _list_cache
+        now = time.monotonic()
+        if _list_cache is not None and now < _list_cache[0]:
+            return _list_cache[1]
+
         db = database.get_db()
-        meetings = []
 
-        cursor = db.meetings.find({}).sort("created_at", -1)
-        async for meeting in cursor:
-            meeting["id"] = str(meeting["_id"])
-            meetings.append(Meeting(**meeting))
+        # The list view never shows transcripts, so leave the (possibly
+        # huge) full_transcription field on the server. Explicit batch
+        # size keeps getMore round-trips low without letting the driver
+        # return arbitrarily large batches
+        cursor = (
+            db.meetings.find(_LIST_FILTER, _LIST_PROJECTION)
+            .sort(_LIST_SORT)
+            .batch_size(config.MEETINGS_BATCH_SIZE)
+        )
+        docs = await cursor.to_list(length=None)
 
+        meetings = []
+        for meeting in docs:
+            meetings.append({
+                "id": str(meeting["_id"]),
+                "title": meeting.get("title", ""),
+                "description": meeting.get("description", ""),
+                "keywords": meeting.get("keywords", []),
+                "created_at": meeting.get("created_at"),
+                "updated_at": meeting.get("updated_at"),
+                "status": meeting.get("status", "created"),
+                "full_transcription": meeting.get("full_transcription")
+            })
+
+        _list_cache = (now + _LIST_CACHE_TTL, meetings)
         return meetings
 
     @staticmethod
-    async def get_meeting(meeting_id: str) -> Meeting:
-        """Get a specific meeting by ID."""
-        if not ObjectId.is_valid(meeting_id):
-            raise HTTPException(status_code=400, detail="Invalid meeting ID")
+    async def get_meeting(oid: ObjectId) -> Any:
+        """Get a specific meeting by its parsed ObjectId.
+
+        Returns a Meeting model, or a prebuilt JSON Response for large
+        transcripts (FastAPI passes Response objects through untouched).
+        """
+        meeting_id = str(oid)
+        cached = _meeting_cache.get(meeting_id)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                value = cached[1]
+                if isinstance(value, bytes):
+                    return Response(content=value, media_type="application/json")
+                return value
+            # Expired: drop it now rather than waiting for a write
+            _meeting_cache.pop(meeting_id, None)
 
         db = database.get_db()
-        meeting = await db.meetings.find_one({"_id": ObjectId(meeting_id)})
+        meeting = await db.meetings.find_one({"_id": oid})
 
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
-        meeting["id"] = str(meeting["_id"])
-        return Meeting(**meeting)
+        # Hours of speech make the JSON encode itself event-loop
+        # visible; render large transcripts in a worker thread and
+        # bypass the model path entirely
+        transcript = meeting.get("full_transcription")
+        if transcript is not None and len(transcript) > _LARGE_TRANSCRIPT_CHARS:
+            payload = await asyncio.to_thread(_render_meeting_doc, meeting)
+            _cache_meeting(meeting_id, payload)
+            return Response(content=payload, media_type="application/json")
+
+        # The document comes from our own database, so skip pydantic
+        # validation via model_construct. It doesn't apply aliases, so
+        # fields are mapped explicitly by their Python names
+        meeting_model = Meeting.model_construct(
+            id=str(meeting["_id"]),
+            title=meeting.get("title", ""),
+            description=meeting.get("description", ""),
+            keywords=meeting.get("keywords", []),
+            createdAt=meeting.get("created_at"),
+            updatedAt=meeting.get("updated_at"),
+            status=meeting.get("status", "created"),
+            fullTranscription=meeting.get("full_transcription")
+        )
+        _cache_meeting(meeting_id, meeting_model)
+        return meeting_model
 
     @staticmethod
-    async def update_meeting(meeting_id: str, meeting_update: MeetingUpdate) -> Meeting:
+    async def update_meeting(oid: ObjectId, meeting_update: MeetingUpdate) -> Meeting:
         """Update a meeting."""
-        if not ObjectId.is_valid(meeting_id):
-            raise HTTPException(status_code=400, detail="Invalid meeting ID")
-
-        update_data = {k: v for k, v in meeting_update.model_dump().items() if v is not None}
+        # exclude_unset/exclude_none happen inside pydantic's C core
+        # instead of a Python dict comprehension over every field
+        update_data = meeting_update.model_dump(exclude_unset=True, exclude_none=True)
         if not update_data:
             raise HTTPException(status_code=400, detail="No valid update data provided")
 
         update_data["updated_at"] = datetime.now(timezone.utc)
 
         db = database.get_db()
-        result = await db.meetings.update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": update_data}
+        # Update and fetch in one command instead of update_one + find_one
+        updated_meeting = await db.meetings.find_one_and_update(
+            {"_id": oid},
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
         )
 
-        if result.matched_count == 0:
+        if not updated_meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
-        updated_meeting = await db.meetings.find_one({"_id": ObjectId(meeting_id)})
         updated_meeting["id"] = str(updated_meeting["_id"])
+        invalidate_meeting_cache(str(oid))
         return Meeting(**updated_meeting)
 
     @staticmethod
-    async def delete_meeting(meeting_id: str) -> dict:
+    async def delete_meeting(oid: ObjectId) -> dict:
         """Delete a meeting."""
-        if not ObjectId.is_valid(meeting_id):
-            raise HTTPException(status_code=400, detail="Invalid meeting ID")
-
         db = database.get_db()
-        result = await db.meetings.delete_one({"_id": ObjectId(meeting_id)})
+        result = await db.meetings.delete_one({"_id": oid})
 
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
+        invalidate_meeting_cache(str(oid))
         return {"message": "Meeting deleted successfully"}
 
     @staticmethod
-    async def update_keywords(meeting_id: str, keywords_update: KeywordsUpdate) -> Meeting:
+    async def update_keywords(oid: ObjectId, keywords_update: KeywordsUpdate) -> Meeting:
         """Update keywords for a specific meeting."""
-        if not ObjectId.is_valid(meeting_id):
-            raise HTTPException(status_code=400, detail="Invalid meeting ID")
-
         update_data = {
             "keywords": keywords_update.keywords,
             "updated_at": datetime.now(timezone.utc)
         }
 
         db = database.get_db()
-        result = await db.meetings.update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": update_data}
+        # Update and fetch in one command instead of update_one + find_one
+        updated_meeting = await db.meetings.find_one_and_update(
+            {"_id": oid},
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
         )
 
-        if result.matched_count == 0:
+        if not updated_meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
-        updated_meeting = await db.meetings.find_one({"_id": ObjectId(meeting_id)})
         updated_meeting["id"] = str(updated_meeting["_id"])
+        invalidate_meeting_cache(str(oid))
         return Meeting(**updated_meeting)
 
     @staticmethod
     async def update_status(meeting_id: str, status: str) -> None:
-        """Update meeting status."""
-        if not ObjectId.is_valid(meeting_id):
+        """Update meeting status.
+
+        Fired from the websocket connect/disconnect path; the status
+        flip is advisory, so an unacknowledged write keeps it from
+        blocking connection setup and teardown on a Mongo round-trip.
+        """
+        try:
+            oid = ObjectId(meeting_id)
+        except (InvalidId, TypeError):
             return
 
         db = database.get_db()
-        await db.meetings.update_one(
-            {"_id": ObjectId(meeting_id)},
+        await db.meetings.with_options(write_concern=WriteConcern(w=0)).update_one(
+            {"_id": oid},
             {"$set": {
                 "status": status,
                 "updated_at": datetime.now(timezone.utc)
             }}
         )
+        invalidate_meeting_cache(meeting_id)
@@ -12,7 +12,21 @@ class TranscriptionService:
         self.transcription_service_url = transcription_service_url
         self.web_server_url = web_server_url
         self.webhook_url = f"{web_server_url}/webhook/transcription-completed"
+        # One keepalive client for all calls; job submission runs once
+        # per audio chunk, so per-call client construction would pay a
+        # TCP handshake on the websocket hot path
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60
+            )
+        )
         logger.info(f"TranscriptionService initialized with URL: {transcription_service_url}")
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client; call during app shutdown."""
+        await self.client.aclose()
     
     async def submit_transcription_job(self, meeting_id: str, filename: str) -> Optional[str]:
         """
@@ -26,23 +40,22 @@ class TranscriptionService:
                 "webhook_url": self.webhook_url
             }
             
-            logger.info(f"Submitting transcription job for meeting {meeting_id}, file {filename}")
+            logger.debug("Submitting transcription job for meeting %s, file %s", meeting_id, filename)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.transcription_service_url}/transcribe",
-                    json=request_data,
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    job_id = result.get("job_id")
-                    logger.info(f"Successfully queued transcription job {job_id} for meeting {meeting_id}, file {filename}")
-                    return job_id
-                else:
-                    logger.error(f"Transcription service error: {response.status_code} - {response.text}")
-                    return None
+            response = await self.client.post(
+                f"{self.transcription_service_url}/transcribe",
+                json=request_data,
+                timeout=30.0
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                job_id = result.get("job_id")
+                logger.debug("Successfully queued transcription job %s for meeting %s, file %s", job_id, meeting_id, filename)
+                return job_id
+            else:
+                logger.error(f"Transcription service error: {response.status_code} - {response.text}")
+                return None
                     
         except httpx.TimeoutException:
             logger.error(f"Timeout submitting transcription job for meeting {meeting_id}")
@@ -62,22 +75,21 @@ class TranscriptionService:
         try:
             logger.info(f"Checking status of transcription job {job_id}")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.transcription_service_url}/jobs/{job_id}",
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    logger.info(f"Job {job_id} status: {result.get('status', 'unknown')}")
-                    return result
-                elif response.status_code == 404:
-                    logger.warning(f"Transcription job {job_id} not found")
-                    return None
-                else:
-                    logger.error(f"Error getting job status: {response.status_code} - {response.text}")
-                    return None
+            response = await self.client.get(
+                f"{self.transcription_service_url}/jobs/{job_id}",
+                timeout=10.0
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                logger.info(f"Job {job_id} status: {result.get('status', 'unknown')}")
+                return result
+            elif response.status_code == 404:
+                logger.warning(f"Transcription job {job_id} not found")
+                return None
+            else:
+                logger.error(f"Error getting job status: {response.status_code} - {response.text}")
+                return None
                     
         except httpx.TimeoutException:
             logger.error(f"Timeout checking status of job {job_id}")
@@ -97,21 +109,20 @@ class TranscriptionService:
         try:
             logger.info(f"Cancelling transcription job {job_id}")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.delete(
-                    f"{self.transcription_service_url}/jobs/{job_id}",
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    logger.info(f"Successfully cancelled transcription job {job_id}")
-                    return True
-                elif response.status_code == 404:
-                    logger.warning(f"Transcription job {job_id} not found for cancellation")
-                    return False
-                else:
-                    logger.error(f"Error cancelling job: {response.status_code} - {response.text}")
-                    return False
+            response = await self.client.delete(
+                f"{self.transcription_service_url}/jobs/{job_id}",
+                timeout=10.0
+            )
+
+            if response.status_code == 200:
+                logger.info(f"Successfully cancelled transcription job {job_id}")
+                return True
+            elif response.status_code == 404:
+                logger.warning(f"Transcription job {job_id} not found for cancellation")
+                return False
+            else:
+                logger.error(f"Error cancelling job: {response.status_code} - {response.text}")
+                return False
                     
         except httpx.TimeoutException:
             logger.error(f"Timeout cancelling job {job_id}")
@@ -129,27 +140,26 @@ class TranscriptionService:
         Returns health info
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.transcription_service_url}/health",
-                    timeout=5.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    logger.info(f"Transcription service health: {result.get('status', 'unknown')}")
-                    return {
-                        "healthy": True,
-                        "status": result.get("status", "unknown"),
-                        "details": result
-                    }
-                else:
-                    logger.warning(f"Transcription service health check failed: {response.status_code}")
-                    return {
-                        "healthy": False,
-                        "status": "unhealthy",
-                        "error": f"HTTP {response.status_code}"
-                    }
+            response = await self.client.get(
+                f"{self.transcription_service_url}/health",
+                timeout=5.0
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                logger.info(f"Transcription service health: {result.get('status', 'unknown')}")
+                return {
+                    "healthy": True,
+                    "status": result.get("status", "unknown"),
+                    "details": result
+                }
+            else:
+                logger.warning(f"Transcription service health check failed: {response.status_code}")
+                return {
+                    "healthy": False,
+                    "status": "unhealthy",
+                    "error": f"HTTP {response.status_code}"
+                }
                     
         except httpx.TimeoutException:
             logger.error("Timeout checking transcription service health")
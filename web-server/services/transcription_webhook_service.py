@@ -7,6 +7,7 @@ from fastapi import HTTPException
 
 from database import database
 from models import TranscriptionWebhookResult
+from .meeting_service import invalidate_meeting_cache, parse_object_id
 
 logger = logging.getLogger(__name__)
 
@@ -28,36 +29,41 @@ class TranscriptionWebhookService:
         Raises:
             HTTPException: If meeting ID is invalid or meeting not found
         """
-        logger.info(
-            f"Received transcription webhook for meeting {result.meeting_id}, "
-            f"file {result.filename}, status: {result.status}"
+        # One webhook per audio chunk: DEBUG with lazy %s formatting so
+        # the hot path never builds messages at the default level
+        logger.debug(
+            "Received transcription webhook for meeting %s, file %s, status: %s",
+            result.meeting_id, result.filename, result.status
         )
 
-        if not ObjectId.is_valid(result.meeting_id):
+        try:
+            meeting_oid = parse_object_id(result.meeting_id)
+        except HTTPException:
             logger.error(f"Invalid meeting ID in webhook: {result.meeting_id}")
-            raise HTTPException(status_code=400, detail="Invalid meeting ID")
+            raise
 
         db = database.get_db()
-        meeting = await db.meetings.find_one({"_id": ObjectId(result.meeting_id)})
+        # Existence check only; the transcript append happens server-side
+        meeting = await db.meetings.find_one({"_id": meeting_oid}, {"_id": 1})
         if not meeting:
             logger.error(f"Meeting not found for webhook: {result.meeting_id}")
             raise HTTPException(status_code=404, detail="Meeting not found")
 
         if result.status == "completed":
-            await TranscriptionWebhookService._handle_success(result, meeting, db, manager)
+            await TranscriptionWebhookService._handle_success(result, meeting_oid, db, manager)
         elif result.status == "failed":
             await TranscriptionWebhookService._handle_failure(result, manager)
 
-        logger.info(
-            f"Successfully processed webhook for meeting {result.meeting_id}, "
-            f"file {result.filename}"
+        logger.debug(
+            "Successfully processed webhook for meeting %s, file %s",
+            result.meeting_id, result.filename
         )
         return {"status": "success", "message": "Webhook processed"}
 
     @staticmethod
     async def _handle_success(
         result: TranscriptionWebhookResult,
-        meeting: dict,
+        meeting_oid: ObjectId,
         db,
         manager
     ):
@@ -65,13 +71,13 @@ class TranscriptionWebhookService:
 
         Args:
             result: Transcription webhook result
-            meeting: Meeting document from database
+            meeting_oid: Parsed meeting ObjectId
             db: Database connection
             manager: WebSocket manager
         """
-        logger.info(
-            f"Processing successful transcription for meeting {result.meeting_id}, "
-            f"file {result.filename}"
+        logger.debug(
+            "Processing successful transcription for meeting %s, file %s",
+            result.meeting_id, result.filename
         )
 
         if not result.transcription_text:
@@ -87,30 +93,35 @@ class TranscriptionWebhookService:
             )
             return
 
-        # Update meeting with transcription result
-        current_transcription = meeting.get("full_transcription", "") or ""
-
-        if current_transcription:
-            updated_transcription = current_transcription + " " + result.transcription_text
-        else:
-            updated_transcription = result.transcription_text
-
-        logger.info(
-            f"Updating meeting {result.meeting_id} with "
-            f"{len(result.transcription_text)} characters from {result.filename}"
+        logger.debug(
+            "Updating meeting %s with %d characters from %s",
+            result.meeting_id, len(result.transcription_text), result.filename
         )
 
+        # Append server-side with an aggregation-pipeline update: the
+        # growing transcript never crosses the wire, and concurrent
+        # webhook deliveries can't lose each other's text to a
+        # read-modify-write race. The text goes in as $literal — in
+        # expression context a transcript starting with "$" would
+        # otherwise be parsed as a field path
+        new_text = {"$literal": result.transcription_text}
         await db.meetings.update_one(
-            {"_id": ObjectId(result.meeting_id)},
-            {"$set": {
-                "full_transcription": updated_transcription,
+            {"_id": meeting_oid},
+            [{"$set": {
+                "full_transcription": {"$cond": [
+                    {"$eq": [{"$ifNull": ["$full_transcription", ""]}, ""]},
+                    new_text,
+                    {"$concat": ["$full_transcription", " ", new_text]}
+                ]},
                 "updated_at": datetime.now(timezone.utc)
-            }}
+            }}]
         )
 
-        logger.info(
-            f"Successfully updated meeting {result.meeting_id} with "
-            f"transcription from {result.filename}"
+        invalidate_meeting_cache(result.meeting_id)
+
+        logger.debug(
+            "Successfully updated meeting %s with transcription from %s",
+            result.meeting_id, result.filename
         )
 
         # Send success notification
@@ -1,5 +1,6 @@
 """WebSocket connection manager for real-time notifications."""
 
+import asyncio
 import logging
 import json
 from typing import Dict, Optional, Any
@@ -15,9 +16,15 @@ class ConnectionManager:
     # Maximum number of concurrent connections allowed per meeting
     MAX_CONNECTIONS_PER_MEETING = 6
 
+    # Per-connection outbound queue bound; messages beyond this are
+    # dropped rather than letting a stalled reader grow memory unbounded
+    SEND_QUEUE_SIZE = 100
+
     def __init__(self):
         """Initialize connection manager."""
         self.active_connections: Dict[str, Dict[str, WebSocket]] = {}
+        self._send_queues: Dict[str, Dict[str, asyncio.Queue]] = {}
+        self._sender_tasks: Dict[str, Dict[str, asyncio.Task]] = {}
 
     async def connect(self, websocket: WebSocket, meeting_id: str, connection_id: str):
         """Accept a WebSocket connection and store it.
@@ -44,7 +51,8 @@ class ConnectionManager:
                 )
                 await websocket.close(code=1008, reason="Connection limit reached")
                 logger.warning(
-                    f"Connection rejected for meeting {meeting_id}: limit of {self.MAX_CONNECTIONS_PER_MEETING} reached"
+                    "Connection rejected for meeting %s: limit of %d reached",
+                    meeting_id, self.MAX_CONNECTIONS_PER_MEETING
                 )
                 raise WebSocketException(code=1008, reason="Connection limit reached")
 
@@ -56,10 +64,20 @@ class ConnectionManager:
 
         self.active_connections[meeting_id][connection_id] = websocket
 
+        # Outbound messages go through a per-connection queue drained by
+        # a dedicated sender task, so a slow reader only backs up its
+        # own queue instead of stalling broadcasts to the whole meeting
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.SEND_QUEUE_SIZE)
+        self._send_queues.setdefault(meeting_id, {})[connection_id] = queue
+        self._sender_tasks.setdefault(meeting_id, {})[connection_id] = asyncio.create_task(
+            self._sender(websocket, queue, meeting_id, connection_id),
+            name=f"ws-sender-{meeting_id}-{connection_id}"
+        )
+
         connection_count = len(self.active_connections[meeting_id])
         logger.info(
-            f"WebSocket connected for meeting {meeting_id}, connection {connection_id} "
-            f"({connection_count}/{self.MAX_CONNECTIONS_PER_MEETING} connections)"
+            "WebSocket connected for meeting %s, connection %s (%d/%d connections)",
+            meeting_id, connection_id, connection_count, self.MAX_CONNECTIONS_PER_MEETING
         )
 
         # Send acknowledgement to the new connection
@@ -77,6 +95,54 @@ class ConnectionManager:
             })
         )
 
+    async def _sender(
+        self,
+        websocket: WebSocket,
+        queue: asyncio.Queue,
+        meeting_id: str,
+        connection_id: str
+    ):
+        """Drain one connection's outbound queue onto its socket.
+
+        Messages are sent as individual frames (clients parse one JSON
+        document per frame). A failed send marks the connection dead.
+        """
+        while True:
+            message = await queue.get()
+            try:
+                await websocket.send_text(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    "Failed to send message to meeting %s, connection %s: %s",
+                    meeting_id, connection_id, e
+                )
+                self.disconnect(meeting_id, connection_id)
+                break
+
+    def _enqueue(self, meeting_id: str, connection_id: str, message: str) -> bool:
+        """Queue a message for one connection's sender task.
+
+        Returns:
+            True if the message was queued, False if the connection is
+            gone or its queue is full (message dropped)
+        """
+        queue = self._send_queues.get(meeting_id, {}).get(connection_id)
+        if queue is None:
+            return False
+        try:
+            queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            # Fires per dropped message under backpressure; keep the
+            # formatting lazy
+            logger.warning(
+                "Send queue full for meeting %s, connection %s; dropping message",
+                meeting_id, connection_id
+            )
+            return False
+
     def disconnect(self, meeting_id: str, connection_id: str):
         """Remove a WebSocket connection.
 
@@ -84,18 +150,30 @@ class ConnectionManager:
             meeting_id: Meeting identifier
             connection_id: Unique identifier for the connection to remove
         """
+        tasks = self._sender_tasks.get(meeting_id)
+        if tasks is not None:
+            task = tasks.pop(connection_id, None)
+            if task:
+                task.cancel()
+            if not tasks:
+                del self._sender_tasks[meeting_id]
+        queues = self._send_queues.get(meeting_id)
+        if queues is not None:
+            queues.pop(connection_id, None)
+            if not queues:
+                del self._send_queues[meeting_id]
         if meeting_id in self.active_connections:
             if connection_id in self.active_connections[meeting_id]:
                 del self.active_connections[meeting_id][connection_id]
                 logger.info(
-                    f"WebSocket disconnected for meeting {meeting_id}, connection {connection_id} "
-                    f"({len(self.active_connections[meeting_id])} remaining)"
+                    "WebSocket disconnected for meeting %s, connection %s (%d remaining)",
+                    meeting_id, connection_id, len(self.active_connections[meeting_id])
                 )
 
                 # Clean up meeting key if no more connections
                 if not self.active_connections[meeting_id]:
                     del self.active_connections[meeting_id]
-                    logger.info(f"All connections closed for meeting {meeting_id}")
+                    logger.info("All connections closed for meeting %s", meeting_id)
 
     def get_connection_count(self, meeting_id: str) -> int:
         """Get the number of active connections for a meeting.
@@ -139,32 +217,20 @@ class ConnectionManager:
                 notification["data"] = data
 
             notification_json = json.dumps(notification)
-            dead_connections = []
-
-            # Broadcast to all connections for this meeting
-            for connection_id, websocket in self.active_connections[meeting_id].items():
-                try:
-                    await websocket.send_text(notification_json)
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send notification to meeting {meeting_id}, "
-                        f"connection {connection_id}: {e}"
-                    )
-                    dead_connections.append(connection_id)
-
-            # Remove failed connections
-            for connection_id in dead_connections:
-                self.disconnect(meeting_id, connection_id)
 
-            if dead_connections:
-                logger.info(
-                    f"Removed {len(dead_connections)} dead connection(s) from meeting {meeting_id}"
-                )
-            else:
-                logger.info(
-                    f"Sent notification to {len(self.active_connections.get(meeting_id, {}))} "
-                    f"connection(s) for meeting {meeting_id}: {message}"
-                )
+            # Queue to every connection's sender task; the actual socket
+            # writes happen off this call so a slow reader can't stall
+            # the broadcaster (failed sends are cleaned up by the senders)
+            queued = 0
+            for connection_id in list(self.active_connections[meeting_id]):
+                if self._enqueue(meeting_id, connection_id, notification_json):
+                    queued += 1
+
+            # Fires once per chunk's status update; keep it off INFO
+            logger.debug(
+                "Queued notification for %d connection(s) for meeting %s: %s",
+                queued, meeting_id, message
+            )
 
     async def send_to_connection(
         self,
@@ -179,17 +245,8 @@ class ConnectionManager:
             connection_id: Unique identifier for the connection
             message: Message to send
         """
-        if meeting_id in self.active_connections:
-            if connection_id in self.active_connections[meeting_id]:
-                try:
-                    await self.active_connections[meeting_id][connection_id].send_text(message)
-                    logger.debug(
-                        f"Sent message to meeting {meeting_id}, connection {connection_id}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send message to meeting {meeting_id}, "
-                        f"connection {connection_id}: {e}"
-                    )
-                    # Remove stale connection
-                    self.disconnect(meeting_id, connection_id)
+        if self._enqueue(meeting_id, connection_id, message):
+            logger.debug(
+                "Queued message for meeting %s, connection %s",
+                meeting_id, connection_id
+            )